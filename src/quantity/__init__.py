@@ -527,14 +527,15 @@ used:
 from __future__ import annotations
 
 import operator
+import sys
 from decimal import Decimal as StdLibDecimal
 from fractions import Fraction
 from numbers import Integral, Rational, Real
 from types import MappingProxyType
 from typing import (
-    Any, Callable, Collection, Dict, Generator, Iterator, List,
+    Any, Callable, Collection, Dict, Iterable, Iterator, List,
     MutableMapping, Optional, TYPE_CHECKING, Tuple, Type, TypeVar, Union,
-    overload,
+    cast, overload,
     )
 
 from decimalfp import Decimal, ONE, ROUNDING, get_dflt_rounding_mode
@@ -581,10 +582,14 @@ ConverterT = Callable[..., Optional[Rational]]
 AmountUnitTupleT = Tuple[Rational, Optional['Unit']]
 #: Result of binary operations on quantities / units
 BinOpResT = Union['Quantity', Rational, AmountUnitTupleT]
-#: Cache for results of operations on unit definitions
-UnitOpCacheT = MutableMapping[Tuple[BinOpT, 'Unit', 'Unit'], BinOpResT]
+#: Cache for results of operations on unit definitions, held per unit and
+#: operator (keyed by the symbol of the other unit or the exponent, because
+#: hashing a unit means calling `Unit.__hash__`, while str objects cache
+#: their hash)
+UnitOpCacheT = MutableMapping[Union[str, int], AmountUnitTupleT]
 
-_UNIT_OP_CACHE: UnitOpCacheT = {}
+# default format spec for quantities
+_DFLT_FORMAT_SPEC = '{a} {u}'
 
 # Global registry of units
 # [symbol -> unit] map, used to ensure that instances of Unit are singletons
@@ -616,7 +621,9 @@ class Unit:
 
     """
 
-    __slots__ = ['_qty_cls', '_symbol', '_name', '_equiv', '_definition']
+    __slots__ = ['_qty_cls', '_symbol', '_name', '_equiv', '_definition',
+                 '_self_def', '_quantum', '_mul_cache', '_div_cache',
+                 '_pow_cache']
 
     # TODO: remove these class variables after mypy issue #1021 got fixed:
     _qty_cls: QuantityMeta
@@ -624,6 +631,11 @@ class Unit:
     _name: Optional[str]
     _equiv: Optional[Rational]
     _definition: UnitDefT
+    _self_def: UnitDefT
+    _quantum: Optional[Rational]
+    _mul_cache: UnitOpCacheT
+    _div_cache: UnitOpCacheT
+    _pow_cache: UnitOpCacheT
 
     def __new__(cls, symbol: str) -> Unit:
         """Return the Unit registered with symbol `symbol`.
@@ -659,14 +671,14 @@ class Unit:
     @property
     def definition(self) -> UnitDefT:
         """Return the units definition."""
-        return self._definition or UnitDefT(((self, 1),))
+        return self._definition or self._self_def
 
     @property
     def normalized_definition(self) -> UnitDefT:
         """Return the units normalized definition."""
         definition = self._definition
         if definition is None:
-            return UnitDefT(((self, 1),))
+            return self._self_def
         return definition.normalized()
 
     def is_base_unit(self) -> bool:
@@ -679,7 +691,7 @@ class Unit:
 
     def is_ref_unit(self) -> bool:
         """Return True if the unit is a reference unit."""
-        return self is self._qty_cls.ref_unit
+        return self is self._qty_cls._ref_unit
 
     @property
     def qty_cls(self) -> QuantityMeta:
@@ -693,16 +705,81 @@ class Unit:
         Returns None if the quantity class related to the unit does not
         define a quantum.
         """
-        cls = self.qty_cls
-        if cls.quantum is None:
-            return None
-        # cls.quantum not None => cls.ref_unit not None => self._equiv not None
-        assert self._equiv is not None
-        return cls.quantum / self._equiv
+        try:
+            return self._quantum
+        except AttributeError:
+            pass
+        # calculated lazily, because the equivalent of a reference unit is
+        # set after the unit has been created
+        quantum = self._qty_cls.quantum
+        if quantum is not None:
+            # cls.quantum not None => cls.ref_unit not None
+            # => self._equiv not None
+            assert self._equiv is not None
+            quantum = quantum / self._equiv
+        self._quantum = quantum
+        return quantum
+
+    def convert_amounts(self, amounts: Iterable[Rational],
+                        from_unit: Unit) -> List[Rational]:
+        """Return the amounts equivalent to `amounts` in terms of `self`.
+
+        Args:
+            amounts: amounts in terms of `from_unit`
+            from_unit: unit to be converted from
+
+        Returns:
+            list of amounts e so that e * `self` == a * `from_unit` for each
+            a in `amounts`
+
+        Raises:
+            TypeError: `from_unit` is not a unit
+            IncompatibleUnitsError: `from_unit` can't be converted to `self`
+            UnitConversionError: conversion factor not available
+
+        The result is the same as calling
+        `qty_cls(a, from_unit).equiv_amount(self)` for each a in `amounts`,
+        i. e. the amounts are converted to numbers and quantized in the same
+        way as by the constructor of `qty_cls`. If both units have an
+        equivalent in terms of the reference unit, the conversion factor is
+        determined only once and applied to all amounts.
+        """
+        qty_cls = self._qty_cls
+        if not isinstance(from_unit, Unit):
+            raise TypeError(f"Can't convert from a '{type(from_unit)}'.")
+        if from_unit._qty_cls is not qty_cls:
+            msg = "Can't convert a '%s' unit to a '%s' unit."
+            raise IncompatibleUnitsError(msg, from_unit._qty_cls, qty_cls)
+        factor: Optional[Rational] = None
+        if from_unit is not self:
+            # noinspection PyProtectedMember
+            factor = from_unit._get_factor(self)
+            if factor is None:
+                # no factor available, try registered converters
+                res: List[Rational] = []
+                for amnt in amounts:
+                    equiv = qty_cls(amnt, from_unit).equiv_amount(self)
+                    if equiv is None:
+                        raise UnitConversionError(
+                            "Can't convert '%s' to '%s'.", from_unit, self)
+                    res.append(equiv)
+                return res
+        # convert the amounts like the constructor does (incl. quantization);
+        # the constructor is only called when needed
+        amnts: List[Rational]
+        if from_unit.quantum is None:
+            amnts = [amnt if type(amnt) is Decimal or type(amnt) is Fraction
+                     else qty_cls(amnt, from_unit)._amount
+                     for amnt in amounts]
+        else:
+            amnts = [qty_cls(amnt, from_unit)._amount for amnt in amounts]
+        if factor is None:
+            return amnts
+        return [cast(Rational, factor * amnt) for amnt in amnts]
 
     def __hash__(self) -> int:
         """hash(self)"""
-        return hash(self.symbol)
+        return hash(self._symbol)
 
     def __copy__(self) -> Unit:
         """Return self (:class:`Unit` instances are immutable)."""
@@ -711,10 +788,18 @@ class Unit:
     def __deepcopy__(self, memo: Any) -> Unit:
         return self.__copy__()
 
+    def __reduce__(self) -> Tuple[Type[Unit], Tuple[str]]:
+        """Return pickle helper."""
+        # the registered unit is looked up by its symbol when unpickled
+        return Unit, (self._symbol,)
+
     def __eq__(self, other: Any) -> bool:
         """self == other"""
+        # units are singletons, so identity implies equality
+        if self is other:
+            return True
         if isinstance(other, Unit):
-            if self.qty_cls is other.qty_cls:
+            if self._qty_cls is other._qty_cls:
                 if self._equiv is None:
                     assert other._equiv is None
                     return self is other
@@ -726,7 +811,7 @@ class Unit:
     def _compare(self, other: Any, op: CmpOpT) -> bool:
         """Compare self and other using operator op."""
         if isinstance(other, Unit):
-            if self.qty_cls is other.qty_cls:
+            if self._qty_cls is other._qty_cls:
                 factor = self._get_factor(other)
                 if factor is None:
                     raise UnitConversionError("Can't convert '%s' to '%s'.",
@@ -734,7 +819,7 @@ class Unit:
                 else:
                     return op(factor, ONE)
             msg = "Can't compare a '%s' unit and a '%s' unit."
-            raise IncompatibleUnitsError(msg, self.qty_cls, other.qty_cls)
+            raise IncompatibleUnitsError(msg, self._qty_cls, other._qty_cls)
         return NotImplemented
 
     def __lt__(self, other: Any) -> bool:
@@ -777,18 +862,17 @@ class Unit:
     def __mul__(self, other: Quantity) -> BinOpResT:  # noqa: D105
         ...
 
-    def __mul__(self, other: Any, _op_cache: UnitOpCacheT = _UNIT_OP_CACHE) \
-            -> BinOpResT:
+    def __mul__(self, other: Any) -> BinOpResT:
         """self * other"""
-        if isinstance(other, Rational):
+        # fast path for the most common concrete number types (avoids the
+        # comparatively slow instance checks against ABCs)
+        other_type: type = type(other)
+        if other_type is Decimal or other_type is int or \
+                other_type is Fraction:
             return self._qty_cls(other, self)
-        if isinstance(other, Real):
-            return self._qty_cls(Decimal(other), self)
-        if isinstance(other, SIPrefix):
-            return self._qty_cls(other.factor, self)
         if isinstance(other, Unit):
             try:  # try cache
-                return _op_cache[(operator.mul, self, other)]
+                return self._mul_cache[other._symbol]
             except KeyError:
                 pass
             # no cache hit
@@ -801,13 +885,19 @@ class Unit:
                                            other._qty_cls.__name__, ) \
                     from None
             # cache it
-            _op_cache[(operator.mul, self, other)] = (amnt, unit)
+            self._mul_cache[other._symbol] = (amnt, unit)
             return amnt, unit
         if isinstance(other, Quantity):
             # The resulting quantity may get quantized. Therefore we
             # have to calculate the final amount before creating the result!
             amnt, unit = self * other.unit
-            return (other.amount * amnt) * unit
+            return _qty_from_amnt_and_unit(other.amount * amnt, unit)
+        if isinstance(other, Rational):
+            return self._qty_cls(other, self)
+        if isinstance(other, Real):
+            return self._qty_cls(Decimal(other), self)
+        if isinstance(other, SIPrefix):
+            return self._qty_cls(other.factor, self)
         return NotImplemented
 
     @overload
@@ -858,22 +948,23 @@ class Unit:
     def __truediv__(self, other: 'Quantity') -> BinOpResT:  # noqa: D105
         ...
 
-    def __truediv__(self, other: Any,
-                    _op_cache: UnitOpCacheT = _UNIT_OP_CACHE) -> BinOpResT:
+    def __truediv__(self, other: Any) -> BinOpResT:
         """self / other"""
         amnt: Rational
         unit: Optional[Unit]
-        if isinstance(other, Rational):
+        # fast path for the most common concrete number types (avoids the
+        # comparatively slow instance checks against ABCs)
+        other_type: type = type(other)
+        if other_type is Decimal or other_type is int or \
+                other_type is Fraction:
             return self._qty_cls(ONE / other, self)
-        if isinstance(other, Real):
-            return self._qty_cls(ONE / Decimal(other), self)
         if isinstance(other, Unit):
             try:  # try cache
-                return _op_cache[(operator.truediv, self, other)]
+                return self._div_cache[other._symbol]
             except KeyError:
                 pass
             # no cache hit
-            if self.qty_cls is other.qty_cls:
+            if self._qty_cls is other._qty_cls:
                 unit = None
                 if self is other:
                     amnt = ONE
@@ -893,22 +984,32 @@ class Unit:
                                                other._qty_cls.__name__) \
                         from None
             # cache it
-            _op_cache[(operator.truediv, self, other)] = (amnt, unit)
+            self._div_cache[other._symbol] = (amnt, unit)
             return amnt, unit
         if isinstance(other, Quantity):
             # The resulting quantity may get quantized. Therefore we
             # have to calculate the final amount before creating the result!
-            amnt, unit = self / other.unit
-            return (other.amount * amnt) * unit
+            amnt, unit = self / other._unit
+            return _qty_from_amnt_and_unit(amnt / other._amount, unit)
+        if isinstance(other, Rational):
+            return self._qty_cls(ONE / other, self)
+        if isinstance(other, Real):
+            return self._qty_cls(ONE / Decimal(other), self)
         return NotImplemented
 
     def __rtruediv__(self, other: Any) -> Quantity:
         """other / self"""
-        if isinstance(other, Rational):
-            return other * self ** -1
-        if isinstance(other, Real):
-            return Decimal(other) * self ** -1
-        return NotImplemented
+        amnt: Rational
+        other_type: type = type(other)
+        if other_type is Decimal or other_type is int or \
+                other_type is Fraction or isinstance(other, Rational):
+            amnt = other
+        elif isinstance(other, Real):
+            amnt = Decimal(other)
+        else:
+            return NotImplemented
+        res_amnt, unit = self._pow(-1)
+        return unit._qty_cls(amnt * res_amnt, unit)
 
     def __pow__(self, exp: Any) -> Union[Quantity, Rational]:
         """self ** exp"""
@@ -917,29 +1018,46 @@ class Unit:
                 return ONE
             if exp == 1:
                 return self._qty_cls(ONE, self)
+            amnt, unit = self._pow(exp)
+            return unit._qty_cls(amnt, unit)
+        return NotImplemented
+
+    def _pow(self, exp: int) -> Tuple[Rational, Unit]:
+        """Return amount and unit of `self` ** `exp` (with `exp` != 0)."""
+        if exp == 1:
+            # looking up the definition could return another unit with the
+            # same definition (e.g. 'dm³' instead of 'l')
+            return ONE, self
+        try:  # try cache
+            amnt, unit = self._pow_cache[exp]
+        except KeyError:
+            # no cache hit
             res_def = UnitDefT(((self, exp),))
             try:
-                return _qty_from_term(res_def)  # type: ignore
+                amnt, unit = _amnt_and_unit_from_term(res_def)
             except KeyError:
                 raise UndefinedResultError(operator.pow,
                                            self._qty_cls.__name__, exp) \
                     from None
-        return NotImplemented
+            # cache it
+            self._pow_cache[exp] = (amnt, unit)
+        assert unit is not None
+        return amnt, unit
 
     def __repr__(self) -> str:
         """repr(self)"""
-        return f"Unit({self.symbol!r})"
+        return f"Unit({self._symbol!r})"
 
     def __str__(self) -> str:
         """str(self)"""
-        return f"{self.symbol}"
+        return self._symbol
 
     def __format__(self, fmt_spec: str = "") -> str:
         """Convert to string (according to `fmt_spec`).
 
         `fmt_spec` must be a valid format spec for strings.
         """
-        return format(self.symbol, fmt_spec)
+        return format(self._symbol, fmt_spec)
 
     # implement abstract methods of NonNumTermElem to allow instances of
     # Unit to be elements in terms:
@@ -948,13 +1066,13 @@ class Unit:
 
     def norm_sort_key(self) -> int:
         """Return sort key for `self` used for normalization of terms."""
-        return self._qty_cls.norm_sort_key()
+        return self._qty_cls._reg_id
 
     def _get_factor(self, other: NonNumTermElem) -> Optional[Rational]:
         """Return scaling factor f so that f * `other` == 1 * `self`."""
         qty_cls = self._qty_cls
         if isinstance(other, Unit):
-            if self.qty_cls is other.qty_cls:
+            if qty_cls is other._qty_cls:
                 if qty_cls.ref_unit is None:
                     return None
                 assert self._equiv is not None
@@ -996,10 +1114,7 @@ class QuantityMeta(ClassWithDefinitionMeta):
         # reference unit
         if define_as is not None:
             assert define_as, "Given definition is not valid."  # empty Term
-            try:
-                ref_unit_def = UnitDefT(_iter_ref_units(define_as))
-            except TypeError:
-                pass
+            ref_unit_def = _ref_unit_def(define_as)
         ref_unit_symbol = kwds.pop('ref_unit_symbol', None)
         if not ref_unit_symbol and ref_unit_def is not None:
             ref_unit_symbol = str(ref_unit_def)
@@ -1013,15 +1128,9 @@ class QuantityMeta(ClassWithDefinitionMeta):
         assert quantum is None or ref_unit_symbol, \
             "A quantum can only be defined together with a reference unit."
         # default unit class
-        try:
-            clsdict['_unit_cls']
-        except KeyError:
-            clsdict['_unit_cls'] = Unit
+        clsdict.setdefault('_unit_cls', Unit)
         # prevent __dict__ from being built for subclasses of Quantity
-        try:
-            clsdict['__slots__']
-        except KeyError:
-            clsdict['__slots__'] = ()
+        clsdict.setdefault('__slots__', ())
         cls = super().__new__(mcs, name, bases, clsdict,
                               define_as=define_as)
         assert isinstance(cls, QuantityMeta)
@@ -1061,6 +1170,9 @@ class QuantityMeta(ClassWithDefinitionMeta):
             unit._definition = None
             unit._equiv = None
         assert symbol, "A symbol must be given for the unit."
+        # interned symbols speed up lookups with symbols taken from the same
+        # pool (e.g. string literals)
+        symbol = sys.intern(symbol)
         try:
             _SYMBOL_UNIT_MAP[symbol]
         except KeyError:
@@ -1070,6 +1182,10 @@ class QuantityMeta(ClassWithDefinitionMeta):
                 f"Unit with symbol '{symbol}' already registered.")
         unit._symbol = symbol
         unit._name = name
+        unit._self_def = UnitDefT(((unit, 1),))
+        unit._mul_cache = {}
+        unit._div_cache = {}
+        unit._pow_cache = {}
         cls._unit_map[symbol] = unit
         # UnitRegistryT has unique_items=False, so this will not raise an
         # exception!
@@ -1227,6 +1343,56 @@ class QuantityMeta(ClassWithDefinitionMeta):
             raise ValueError(f"'{cls.__name__}' does not have a unit with "
                              f"symbol '{symbol}'.") from None
 
+    def from_amounts(cls, amounts: Iterable[Union[Real, str]],  # noqa: N805
+                     unit: Optional[Unit] = None) -> List[Quantity]:
+        """Return a list of quantities, one for each amount in `amounts`.
+
+        Args:
+            amounts: amounts of the quantities to be created
+            unit: unit of the quantities to be created (defaults to the
+                reference unit of `cls`)
+
+        Returns:
+            list of quantities equal to `cls(amount, unit)` for each amount
+            in `amounts`
+
+        Raises:
+            TypeError: `unit` is not a unit, or an amount is neither a number
+                nor a string that can be converted to a number
+            QuantityError: `unit` is not a unit of `cls`, or no unit given
+                and `cls` does not have a reference unit
+
+        The unit is checked only once. Amounts given as Decimal or Fraction
+        are taken as they are, unless the quantities have to be quantized;
+        all other amounts are converted like in `cls(amount, unit)`.
+        """
+        if unit is None:
+            unit = cls._ref_unit
+            if unit is None:
+                raise QuantityError("A unit must be given.")
+        elif not isinstance(unit, Unit):
+            raise TypeError("Instance of 'Unit' expected as 'unit', got: "
+                            f"{unit!r}.")
+        qty_cls = unit._qty_cls
+        if cls is not Quantity and cls is not qty_cls:
+            raise QuantityError(f"Given unit '{unit}' is not a "
+                                f"'{cls.__name__}' unit.")
+        if unit.quantum is not None:
+            # amounts have to be quantized
+            return [qty_cls(amount, unit) for amount in amounts]
+        qtys: List[Quantity] = []
+        for amount in amounts:
+            amnt_type: type = type(amount)
+            if amnt_type is Decimal or amnt_type is Fraction:
+                # make raw instance
+                qty = cast(Quantity, object.__new__(qty_cls))  # type: ignore
+                qty._amount = cast(Rational, amount)
+                qty._unit = unit
+            else:
+                qty = qty_cls(amount, unit)
+            qtys.append(qty)
+        return qtys
+
     def register_converter(cls, conv: ConverterT) -> None:  # noqa: N805
         """Add converter `conv` to the list of converters registered in cls.
 
@@ -1264,7 +1430,7 @@ class Quantity(metaclass=QuantityMeta):
     __slots__ = ['_amount', '_unit']
 
     # default format spec used in __format__
-    dflt_format_spec = '{a} {u}'
+    dflt_format_spec = _DFLT_FORMAT_SPEC
 
     # TODO: remove these class variables after mypy issue #1021 got fixed:
     _amount: Rational
@@ -1276,7 +1442,14 @@ class Quantity(metaclass=QuantityMeta):
         """Create new `Quantity` instance."""
         qty: Quantity
         amnt: Rational
-        if isinstance(amount, (Decimal, Fraction)):
+        # check the most common concrete types first, in order to avoid the
+        # comparatively slow instance checks against ABCs
+        amnt_type: type = type(amount)
+        if amnt_type is Decimal or amnt_type is Fraction:
+            amnt = cast(Rational, amount)
+        elif amnt_type is int:
+            amnt = Decimal(amount)
+        elif isinstance(amount, (Decimal, Fraction)):
             amnt = amount
         elif isinstance(amount, (Integral, StdLibDecimal)):
             amnt = Decimal(amount)  # convert to decimalfp.Decimal
@@ -1286,48 +1459,28 @@ class Quantity(metaclass=QuantityMeta):
             except ValueError:
                 amnt = Fraction(amount)
         elif isinstance(amount, str):
-            q_repr = amount
-            parts = q_repr.lstrip().split(' ', 1)
-            s_amount = parts[0]
-            try:
-                amnt = Decimal(s_amount)
-            except (TypeError, ValueError):
-                try:
-                    amnt = Fraction(s_amount)
-                except (TypeError, ValueError):
-                    raise QuantityError(f"Can't convert '{s_amount}' to a "
-                                        "rational number.")
-            if len(parts) > 1:
-                s_sym = parts[1].strip()
-                try:
-                    unit_from_sym = _unit_from_symbol(s_sym)
-                except KeyError:
-                    raise QuantityError(f"Unknown symbol '{s_sym}'.") \
-                        from None
-                else:
-                    if unit is None:
-                        unit = unit_from_sym
-                    elif unit is unit_from_sym:
-                        pass
-                    else:
-                        assert unit_from_sym.qty_cls is not None
-                        qty = unit_from_sym.qty_cls(amnt, unit_from_sym)
-                        return qty.convert(unit)
+            amnt, unit_from_sym = _parse_q_repr(amount)
+            if unit_from_sym is not None:
+                if unit is None:
+                    unit = unit_from_sym
+                elif unit is not unit_from_sym:
+                    qty = unit_from_sym._qty_cls(amnt, unit_from_sym)
+                    return qty.convert(unit)
         else:
             raise TypeError("Given amount must be a number or a string "
                             "that can be converted to a number.")
         if unit is None:
-            unit = cls.ref_unit
+            unit = cls._ref_unit
             if unit is None:
                 raise QuantityError("A unit must be given.")
         elif not isinstance(unit, Unit):
             raise TypeError("Instance of 'Unit' expected as 'unit', got: "
                             f"{unit!r}.")
         if cls is Quantity:
-            cls = unit.qty_cls
+            cls = unit._qty_cls
             if cls is None:
                 raise TypeError(f"'{unit}' is not a registered unit.")
-        elif cls is not unit.qty_cls:
+        elif cls is not unit._qty_cls:
             raise QuantityError(f"Given unit '{unit}' is not a "
                                 f"'{cls.__name__}' unit.")
         # make raw instance
@@ -1336,7 +1489,18 @@ class Quantity(metaclass=QuantityMeta):
         # check whether it should be quantized
         quantum = unit.quantum
         if quantum is not None:
-            amnt = Decimal(amnt / quantum, 0) * quantum
+            if quantum == 1 and not (type(quantum) is Decimal and
+                                     quantum.precision > 0):
+                # avoid needless division / multiplication (a quantum with
+                # precision > 0 determines the precision of the result)
+                amnt = Decimal(amnt, 0)
+            elif type(amnt) is Decimal and type(quantum) is Decimal:
+                amnt = amnt.quantize(quantum)
+            else:
+                # arithmetic mixing Decimal and Fraction is very slow, so
+                # calculate with fractions
+                amnt = _decimal_if_exact(
+                    _quantize_fraction(Fraction(amnt), quantum), quantum)
         # finally set amount and unit
         qty._amount = amnt
         qty._unit = unit
@@ -1354,28 +1518,30 @@ class Quantity(metaclass=QuantityMeta):
 
     def equiv_amount(self, unit: Unit) -> Optional[Rational]:
         """Return amount e so that e * `unit` == `self`."""
-        if self.unit == unit:
-            return self.amount
-        try:
-            # noinspection PyProtectedMember
-            factor = self.unit._get_factor(unit)
-        except TypeError:
-            if isinstance(unit, Unit):
+        self_unit = self._unit
+        if self_unit is unit:
+            return self._amount
+        if isinstance(unit, Unit):
+            qty_cls = self_unit._qty_cls
+            if unit._qty_cls is not qty_cls:
                 msg = "Can't convert a '%s' unit to a '%s' unit."
                 raise IncompatibleUnitsError(msg, self.__class__,
-                                             unit.qty_cls) from None
-            else:
-                raise
-        else:
-            if factor is None:
-                # try registered converters:
-                for conv in self.__class__.registered_converters():
-                    amnt = conv(self, unit)
-                    if amnt is not None:
-                        return amnt
-                return None
-            else:
-                return factor * self.amount
+                                             unit.qty_cls)
+            if qty_cls._ref_unit is not None:
+                # fast path: both units have an equivalent in terms of the
+                # reference unit
+                assert self_unit._equiv is not None
+                assert unit._equiv is not None
+                return cast(Rational,
+                            self_unit._equiv / unit._equiv * self._amount)
+            # no reference unit (and units not identical), so there's no
+            # conversion factor; try registered converters:
+            for conv in qty_cls.registered_converters():
+                amnt = conv(self, unit)
+                if amnt is not None:
+                    return amnt
+            return None
+        raise TypeError(f"Can't convert to a '{type(unit)}'.")
 
     def convert(self: Q, to_unit: Unit) -> Q:
         """Return quantity q where q == `self` and q.unit is `to_unit`.
@@ -1389,6 +1555,8 @@ class Quantity(metaclass=QuantityMeta):
         Raises:
             IncompatibleUnitsError: `self` can't be converted to `to_unit`.
         """
+        if to_unit is self._unit:   # nothing to convert
+            return self
         equiv_amount = self.equiv_amount(to_unit)
         if equiv_amount is None:
             raise UnitConversionError("Can't convert '%s' to '%s'.",
@@ -1429,8 +1597,12 @@ class Quantity(metaclass=QuantityMeta):
         if amnt == 0:
             return self
         assert isinstance(num_quant, (Decimal, Fraction))
-        if isinstance(amnt, Decimal):
+        if isinstance(amnt, Decimal) and isinstance(num_quant, Decimal):
             res_amnt = amnt.quantize(num_quant, rounding=rounding)
+        elif isinstance(amnt, Decimal):
+            res_amnt = _decimal_if_exact(
+                _quantize_fraction(Fraction(amnt), num_quant, rounding),
+                num_quant)
         elif isinstance(amnt, Fraction):
             res_amnt = _quantize_fraction(amnt, num_quant, rounding)
         else:
@@ -1465,10 +1637,39 @@ class Quantity(metaclass=QuantityMeta):
                 total = Decimal(total)
             except ValueError:
                 pass
+        # decimalfp is very slow in calculating inexact quotients and in
+        # arithmetic mixing Decimal and Fraction, so fractions are used in
+        # these cases
+        amounts: Collection[Rational]
+        if isinstance(total, Quantity):
+            # all ratios are quantities of the same type (otherwise they
+            # could not have been added), so use their amounts
+            total_unit = total._unit
+            amounts = [cast(Rational,
+                            cast(Quantity, ratio).equiv_amount(total_unit))
+                       for ratio in ratios]
+            total = total._amount
+        else:
+            amounts = cast(Collection[Rational], ratios)
+        f_total = Fraction(total)
         # calculate fractions from ratios
-        fractions = [ratio / total for ratio in ratios]
+        fractions = []
+        for amount in amounts:
+            fraction = Fraction(amount) / f_total
+            fractions.append(amount / total if _is_decimal_fraction(fraction)
+                             else fraction)
         # apportion self according to fractions
-        portions: List[Q] = [self * fraction for fraction in fractions]
+        f_amnt = Fraction(self._amount)
+        cls, unit = self.__class__, self._unit
+        portions: List[Q] = []
+        for fraction in fractions:
+            if type(fraction) is Fraction:
+                share = f_amnt * fraction
+                portions.append(cls(Decimal(share)
+                                    if _is_decimal_fraction(share)
+                                    else share, unit))
+            else:
+                portions.append(self * fraction)
         # check whether there's a remainder
         remainder = self - sum(portions)
         rem_amount = remainder.amount
@@ -1482,7 +1683,8 @@ class Quantity(metaclass=QuantityMeta):
                     quantum = -quantum
                 # calculate rounding errors
                 errors = sorted(map(lambda portion, fraction, idx:
-                                    (portion.amount - self.amount * fraction,
+                                    (Fraction(portion._amount) -
+                                     f_amnt * Fraction(fraction),
                                      idx),
                                     portions, fractions, range(n_portions)),
                                 reverse=(rem_amount < 0))
@@ -1497,23 +1699,25 @@ class Quantity(metaclass=QuantityMeta):
     def __eq__(self, other: Any) -> bool:
         """self == other"""
         if isinstance(other, self.__class__):
-            if self.unit is other.unit:
-                return self.amount == other.amount
-            equiv = other.equiv_amount(self.unit)
+            self_unit = self._unit
+            if self_unit is other._unit:
+                return self._amount == other._amount
+            equiv = other.equiv_amount(self_unit)
             if equiv is not None:
-                return self.amount == equiv
+                return self._amount == equiv
         return False
 
     def _compare(self, other: Any, op: CmpOpT) -> bool:
         """Compare self and other using operator op."""
         if isinstance(other, self.__class__):
-            if self.unit is other.unit:
-                return op(self.amount, other.amount)
-            equiv = other.equiv_amount(self.unit)
+            self_unit = self._unit
+            if self_unit is other._unit:
+                return op(self._amount, other._amount)
+            equiv = other.equiv_amount(self_unit)
             if equiv is None:
                 raise UnitConversionError("Can't convert '%s' to '%s'.",
-                                          other.unit, self.unit)
-            return op(self.amount, equiv)
+                                          other._unit, self_unit)
+            return op(self._amount, equiv)
         elif isinstance(other, Quantity):
             raise IncompatibleUnitsError("Can't compare a '%s' and a '%s'.",
                                          self.__class__, other.__class__)
@@ -1537,11 +1741,19 @@ class Quantity(metaclass=QuantityMeta):
 
     def __hash__(self) -> int:
         """hash(self)"""
-        return hash((self.amount, self.unit))
+        # hash(unit) == hash(unit._symbol), so hashing the symbol gives the
+        # same result without calling Unit.__hash__
+        return hash((self._amount, self._unit._symbol))
+
+    def __reduce__(self) -> Tuple[QuantityMeta, Tuple[Rational, Unit]]:
+        """Return pickle helper."""
+        # amount and unit are passed as they are, so that no string
+        # representation has to be parsed when unpickled
+        return self.__class__, (self._amount, self._unit)
 
     def __abs__(self: Q) -> Q:
         """abs(self) -> self.Quantity(abs(self.amount), self.unit)"""
-        return self.__class__(abs(self._amount), self.unit)
+        return _make_qty(self.__class__, abs(self._amount), self._unit)
 
     def __pos__(self: Q) -> Q:
         """+self"""
@@ -1549,18 +1761,22 @@ class Quantity(metaclass=QuantityMeta):
 
     def __neg__(self: Q) -> Q:
         """-self -> self.Quantity(-self.amount, self.unit)"""
-        return self.__class__(-self.amount, self.unit)
+        return _make_qty(self.__class__, -self._amount, self._unit)
 
     def __add__(self: Q, other: Q) -> Q:
         """self + other"""
         if isinstance(other, self.__class__):
-            if self.unit == other.unit:
-                return self.__class__(self.amount + other.amount, self.unit)
-            equiv = other.equiv_amount(self.unit)
+            self_unit = self._unit
+            # units are singletons, so use identity check for the fast path
+            if self_unit is other._unit:
+                # both amounts are valid for the unit, so is the result
+                return _make_qty(self.__class__,
+                                 self._amount + other._amount, self_unit)
+            equiv = other.equiv_amount(self_unit)
             if equiv is None:
                 raise UnitConversionError("Can't convert '%s' to '%s'.",
-                                          other.unit, self.unit)
-            return self.__class__(self.amount + equiv, self.unit)
+                                          other._unit, self_unit)
+            return self.__class__(self._amount + equiv, self_unit)
         elif isinstance(other, Quantity):
             raise IncompatibleUnitsError("Can't add a '%s' and a '%s'.",
                                          self.__class__, other.__class__)
@@ -1572,13 +1788,17 @@ class Quantity(metaclass=QuantityMeta):
     def __sub__(self: Q, other: Q) -> Q:
         """self - other"""
         if isinstance(other, self.__class__):
-            if self.unit == other.unit:
-                return self.__class__(self.amount - other.amount, self.unit)
-            equiv = other.equiv_amount(self.unit)
+            self_unit = self._unit
+            # units are singletons, so use identity check for the fast path
+            if self_unit is other._unit:
+                # both amounts are valid for the unit, so is the result
+                return _make_qty(self.__class__,
+                                 self._amount - other._amount, self_unit)
+            equiv = other.equiv_amount(self_unit)
             if equiv is None:
                 raise UnitConversionError("Can't convert '%s' to '%s'.",
-                                          other.unit, self.unit)
-            return self.__class__(self.amount - equiv, self.unit)
+                                          other._unit, self_unit)
+            return self.__class__(self._amount - equiv, self_unit)
         elif isinstance(other, Quantity):
             raise IncompatibleUnitsError("Can't subtract a '%s' from a '%s'.",
                                          other.__class__, self.__class__)
@@ -1613,20 +1833,31 @@ class Quantity(metaclass=QuantityMeta):
 
     def __mul__(self, other: Any) -> BinOpResT:
         """self * other"""
-        if isinstance(other, Rational):
-            return self.__class__(self.amount * other, self.unit)
+        # fast path for the most common concrete number types (avoids the
+        # comparatively slow instance checks against ABCs)
+        other_type: type = type(other)
+        if other_type is Decimal or other_type is int or \
+                other_type is Fraction:
+            return self.__class__(self._amount * other, self._unit)
         if isinstance(other, Quantity):
             # The resulting quantity may get quantized. Therefore we
             # have to calculate the final amount before creating the result!
-            amnt, unit = self.unit * other.unit
-            return (self.amount * other.amount * amnt) * unit
+            self_unit, other_unit = self._unit, other._unit
+            try:  # try cache directly (saves the call of Unit.__mul__)
+                amnt, unit = self_unit._mul_cache[other_unit._symbol]
+            except KeyError:
+                amnt, unit = self_unit * other_unit
+            return _qty_from_amnt_and_unit(self._amount * other._amount *
+                                           amnt, unit)
         if isinstance(other, Unit):
             # The resulting quantity may get quantized. Therefore we
             # have to calculate the final amount before creating the result!
-            amnt, unit = self.unit * other
-            return (self.amount * amnt) * unit
+            amnt, unit = self._unit * other
+            return _qty_from_amnt_and_unit(self._amount * amnt, unit)
+        if isinstance(other, Rational):
+            return self.__class__(self._amount * other, self._unit)
         if isinstance(other, Real):
-            return self.__class__(self.amount * Decimal(other), self.unit)
+            return self.__class__(self._amount * Decimal(other), self._unit)
         return NotImplemented
 
     # other * self
@@ -1654,53 +1885,77 @@ class Quantity(metaclass=QuantityMeta):
 
     def __truediv__(self, other: Any) -> BinOpResT:
         """self / other"""
-        if isinstance(other, Rational):
-            return self.__class__(self.amount / other, self.unit)
+        # fast path for the most common concrete number types (avoids the
+        # comparatively slow instance checks against ABCs)
+        other_type: type = type(other)
+        if other_type is Decimal or other_type is int or \
+                other_type is Fraction:
+            return self.__class__(self._amount / other, self._unit)
         if isinstance(other, Quantity):
             if self.__class__ is other.__class__:
-                equiv_amount = other.equiv_amount(self.unit)
+                equiv_amount = other.equiv_amount(self._unit)
                 if equiv_amount is None:
                     raise UnitConversionError("Can't convert '%s' to '%s'.",
-                                              other.unit, self.unit)
+                                              other._unit, self._unit)
                 else:
-                    return self.amount / equiv_amount
+                    return self._amount / equiv_amount
             else:
                 # The resulting quantity may get quantized. Therefore we
                 # have to calculate the final amount before creating the
                 # result!
-                amnt, unit = self.unit / other.unit
-                return (self.amount / other.amount * amnt) * unit
+                self_unit, other_unit = self._unit, other._unit
+                try:  # try cache directly (saves the call of Unit.__truediv__)
+                    amnt, unit = self_unit._div_cache[other_unit._symbol]
+                except KeyError:
+                    amnt, unit = self_unit / other_unit
+                return _qty_from_amnt_and_unit(
+                    self._amount / other._amount * amnt, unit)
         if isinstance(other, Unit):
-            if self.__class__ is other.qty_cls:
+            if self.__class__ is other._qty_cls:
                 equiv_amount = self.equiv_amount(other)
                 if equiv_amount is None:
                     raise UnitConversionError("Can't convert '%s' to '%s'.",
-                                              self.unit, other)
+                                              self._unit, other)
                 else:
                     return equiv_amount
             else:
                 # The resulting quantity may get quantized. Therefore we
                 # have to calculate the final amount before creating the
                 # result!
-                amnt, unit = self.unit / other
-                return (self.amount * amnt) * unit
+                amnt, unit = self._unit / other
+                return _qty_from_amnt_and_unit(self._amount * amnt, unit)
+        if isinstance(other, Rational):
+            return self.__class__(self._amount / other, self._unit)
         if isinstance(other, Real):
-            return self.__class__(self.amount / Decimal(other), self.unit)
+            return self.__class__(self._amount / Decimal(other), self._unit)
         return NotImplemented
 
     def __rtruediv__(self, other: Any) -> Quantity:
         """other / self"""
-        if isinstance(other, Rational):
-            return (other / self.amount) * self.unit ** -1
-        if isinstance(other, Real):
-            return (other / Decimal(self.amount)) * self.unit ** -1
-        return NotImplemented
+        other_type: type = type(other)
+        if other_type is Decimal or other_type is int or \
+                other_type is Fraction or isinstance(other, Rational):
+            amnt = other / self._amount
+        elif isinstance(other, Real):
+            amnt = other / Decimal(self._amount)
+        else:
+            return NotImplemented
+        # The resulting quantity may get quantized. Therefore we have to
+        # calculate the final amount before creating the result!
+        # noinspection PyProtectedMember
+        res_amnt, unit = self._unit._pow(-1)
+        return unit._qty_cls(amnt * res_amnt, unit)
 
     def __pow__(self, exp: int) -> Quantity:
         """self ** exp"""
         if not isinstance(exp, int):
             return NotImplemented
-        return self.amount ** exp * self.unit ** exp
+        if exp == 0:
+            return self._amount ** exp * ONE
+        # The resulting quantity may get quantized. Therefore we have to
+        # calculate the final amount before creating the result!
+        amnt, unit = self._unit._pow(exp)
+        return unit._qty_cls(self._amount ** exp * amnt, unit)
 
     def __round__(self: Q, n_digits: int = 0) -> Q:
         """Return copy of `self` with its amount rounded to `n_digits`.
@@ -1711,19 +1966,19 @@ class Quantity(metaclass=QuantityMeta):
         Returns:
             round(self.amount, n_digits) * self.unit
         """
-        return self.__class__(round(self.amount, n_digits), self.unit)
+        return self.__class__(round(self._amount, n_digits), self._unit)
 
     def __repr__(self) -> str:
         """repr(self)"""
         cls = self.__class__
-        if self.unit is cls.ref_unit:
-            return f"{cls.__name__}({self.amount!r})"
+        if self._unit is cls._ref_unit:
+            return f"{cls.__name__}({self._amount!r})"
         else:
-            return f"{cls.__name__}({self.amount!r}, {self.unit!r})"
+            return f"{cls.__name__}({self._amount!r}, {self._unit!r})"
 
     def __str__(self) -> str:
         """str(self)"""
-        return f"{self.amount} {self.unit}"
+        return f"{self._amount} {self._unit}"
 
     def __format__(self, fmt_spec: str = "") -> str:
         """Convert to string (according to format specifier).
@@ -1735,20 +1990,58 @@ class Quantity(metaclass=QuantityMeta):
         """
         if not fmt_spec:
             fmt_spec = self.dflt_format_spec
-        return fmt_spec.format(a=self.amount, u=self.unit)
+        if fmt_spec == _DFLT_FORMAT_SPEC:
+            # shortcut avoiding to parse the format spec
+            return f"{self._amount} {self._unit}"
+        return fmt_spec.format(a=self._amount, u=self._unit)
+
+
+# Term normalization treats elements with a sort key <= 0 as numerical, so
+# the abstract base class must hold registry index 0, making the sort keys
+# of all concrete quantity classes (and their units) > 0.
+assert Quantity._reg_id == 0
 
 
 # helper functions
 
-def _iter_ref_units(cls_def: QuantityClsDefT) \
-        -> Generator[Tuple[Unit, int], None, None]:
+def _ref_unit_def(cls_def: QuantityClsDefT) -> Optional[UnitDefT]:
+    # Return the definition of the reference unit derived from `cls_def`, or
+    # None if not all quantity classes in `cls_def` have a reference unit
+    items = []
     for qty_cls, exp in cls_def:
-        if isinstance(qty_cls, QuantityMeta):
-            ref_unit = qty_cls.ref_unit
-            if ref_unit is not None:
-                yield ref_unit, exp
-            else:
-                raise TypeError
+        if not isinstance(qty_cls, QuantityMeta):
+            return None
+        ref_unit = qty_cls._ref_unit
+        if ref_unit is None:
+            return None
+        items.append((ref_unit, exp))
+    return UnitDefT(items)
+
+
+def _parse_q_repr(q_repr: str) -> Tuple[Rational, Optional[Unit]]:
+    # Return amount and unit (None if no symbol given) from string
+    # representation of a quantity
+    parts = q_repr.lstrip().split(' ', 1)
+    s_amount = parts[0]
+    amnt: Rational
+    try:
+        if '/' in s_amount:     # can't be a decimal number
+            amnt = Fraction(s_amount)
+        else:
+            try:
+                amnt = Decimal(s_amount)
+            except ValueError:
+                amnt = Fraction(s_amount)
+    except (TypeError, ValueError):
+        raise QuantityError(f"Can't convert '{s_amount}' to a "
+                            "rational number.") from None
+    if len(parts) > 1:
+        s_sym = parts[1].strip()
+        try:
+            return amnt, _unit_from_symbol(s_sym)
+        except KeyError:
+            raise QuantityError(f"Unknown symbol '{s_sym}'.") from None
+    return amnt, None
 
 
 def _amnt_and_unit_from_term(term: UnitDefT) -> AmountUnitTupleT:
@@ -1766,12 +2059,27 @@ def _amnt_and_unit_from_term(term: UnitDefT) -> AmountUnitTupleT:
     return num, res_unit
 
 
-def _qty_from_term(term: UnitDefT) -> BinOpResT:
-    amnt, unit = _amnt_and_unit_from_term(term)
-    assert unit is not None
-    qty_cls = unit.qty_cls
-    assert qty_cls is not None
-    return qty_cls(amnt, unit)
+def _make_qty(qty_cls: Type[Q], amnt: Rational, unit: Unit) -> Q:
+    # Return instance of `qty_cls` with given amount and unit, bypassing the
+    # checks and conversions done in Quantity.__new__, i.e. `amnt` must be of
+    # a valid type and valid for `unit`
+    # If the unit has a quantum, Quantity.__new__ is still needed, because
+    # it standardizes the amount (e.g. its precision)
+    if unit.quantum is not None:
+        return qty_cls(amnt, unit)
+    qty = object.__new__(qty_cls)
+    qty._amount = amnt
+    qty._unit = unit
+    return qty
+
+
+def _qty_from_amnt_and_unit(amnt: Rational, unit: Optional[Unit]) \
+        -> Union[Quantity, Rational]:
+    # Return amnt * unit as quantity, or amnt if unit is None (i.e. the units
+    # of an operation cancelled out)
+    if unit is None:
+        return amnt
+    return unit._qty_cls(amnt, unit)
 
 
 def _floordiv_rounded(x: int, y: int,
@@ -1853,10 +2161,31 @@ def _floordiv_rounded(x: int, y: int,
     raise ValueError(f"Invalid rounding mode: {rounding!r}.")
 
 
+def _is_decimal_fraction(frac: Fraction) -> bool:
+    """Return True if `frac` can be converted exactly to a Decimal."""
+    # the denominator must not have prime factors other than 2 and 5
+    denom = frac.denominator
+    return 10 ** denom.bit_length() % denom == 0
+
+
+def _decimal_if_exact(amnt: Rational, quant: Rational) -> Rational:
+    """Return `amnt` as Decimal, if it can be converted exactly."""
+    # `amnt` is a multiple of `quant`; the result is the same as multiplying
+    # a Decimal by `quant` with decimalfp, i.e. its precision is the one of
+    # `quant` if `quant` is a decimal fraction, otherwise the minimal one
+    if type(amnt) is Fraction and _is_decimal_fraction(amnt):
+        f_quant = Fraction(quant)
+        if _is_decimal_fraction(f_quant):
+            return Decimal(amnt, Decimal(f_quant).precision)
+        return Decimal(amnt)
+    return amnt
+
+
 def _quantize_fraction(self: Fraction, quant: Rational,
                        rounding: Optional[ROUNDING] = None) -> Fraction:
     """Return integer multiple of `quant` closest to `self`."""
-    quot: Fraction = self / quant
+    # dividing by a Decimal would be very slow
+    quot: Fraction = self / Fraction(quant)
     mult = _floordiv_rounded(quot.numerator, quot.denominator,
                              rounding=rounding)
     return mult * quant
@@ -27,8 +27,10 @@ class ClassWithDefinitionMeta(type):
 
     """Meta class allowing to construct classes with terms as definitions."""
 
-    # TODO: remove this class variable after mypy issue #1021 got fixed:
+    # TODO: remove these class variables after mypy issue #1021 got fixed:
     _definition: Optional[ClassDefT]
+    _self_def: ClassDefT
+    _sort_key: int
 
     def __new__(mcs, name: str, bases: Tuple[type, ...],    # noqa: N804
                 clsdict: Dict[str, Any],
@@ -47,20 +49,24 @@ class ClassWithDefinitionMeta(type):
                 "All elements of definition given in 'define_as' must be " \
                 f"instances of '{mcs.__name__}'."
         cls._definition = define_as
+        # term consisting only of cls (used in definitions and class algebra)
+        cls._self_def = ClassDefT(((cls, 1),))
+        # sort key (depends only on the class name, so calculate it once)
+        cls._sort_key = _name_sort_key(name)
         return cls
 
     @property
     def definition(cls) -> ClassDefT:
         """Definition of `cls`."""
         if cls._definition is None:
-            return ClassDefT(((cls, 1),))
+            return cls._self_def
         return cls._definition
 
     @property
     def normalized_definition(cls) -> ClassDefT:
         """Normalized definition of `cls`."""       # noqa: D401
         if cls._definition is None:
-            return ClassDefT(((cls, 1),))
+            return cls._self_def
         else:
             return cls._definition.normalized()
 
@@ -81,7 +87,7 @@ class ClassWithDefinitionMeta(type):
         if isinstance(other, Term):
             if all((isinstance(elem, ClassWithDefinitionMeta)
                     for (elem, exp) in other)):
-                return ClassDefT(((cls, 1),)) * other
+                return cls._self_def * other
         return NotImplemented
 
     def __rmul__(cls, other: ClassDefT) -> ClassDefT:
@@ -89,7 +95,7 @@ class ClassWithDefinitionMeta(type):
         if isinstance(other, Term):
             if all((isinstance(elem, ClassWithDefinitionMeta)
                     for (elem, exp) in other)):
-                return other * ClassDefT(((cls, 1),))
+                return other * cls._self_def
         return NotImplemented
 
     def __truediv__(cls, other: Union[ClassWithDefinitionMeta,
@@ -100,7 +106,7 @@ class ClassWithDefinitionMeta(type):
         if isinstance(other, Term):
             if all((isinstance(elem, ClassWithDefinitionMeta)
                     for (elem, exp) in other)):
-                return ClassDefT(((cls, 1),)) * other.reciprocal()
+                return cls._self_def * other.reciprocal()
         return NotImplemented
 
     def __rtruediv__(cls, other: ClassDefT) -> ClassDefT:
@@ -113,7 +119,8 @@ class ClassWithDefinitionMeta(type):
 
     def __pow__(cls, exp: int) -> ClassDefT:
         """Return class definition: `cls` ** `exp`."""
-        if isinstance(exp, Integral):
+        # check for int first, avoiding the slower ABC check in most cases
+        if type(exp) is int or isinstance(exp, Integral):
             return ClassDefT(((cls, exp),))
         return NotImplemented
 
@@ -128,17 +135,22 @@ class ClassWithDefinitionMeta(type):
 
     def norm_sort_key(cls) -> int:
         """Return sort key for `cls` used for normalization of terms."""
-        cn = cls.__name__
-        ln = len(cn)
-        sn = cn[:25]
-        k = 0
-        for i in range(len(sn)):
-            k = (k << 7) + ord(sn[i])
-        for i in range(25 - len(sn)):
-            k = (k << 7)
-        k = (k << 7) + max(ln, 127)
-        return k
+        return cls._sort_key
 
     def _get_factor(cls, other: NonNumTermElem) -> Optional[Rational]:
         """Instances are not convertable, raise TypeError."""
         raise TypeError
+
+
+def _name_sort_key(name: str) -> int:
+    # Return sort key derived from the first 25 chars of `name` (plus its
+    # length)
+    ln = len(name)
+    sn = name[:25]
+    k = 0
+    for i in range(len(sn)):
+        k = (k << 7) + ord(sn[i])
+    for i in range(25 - len(sn)):
+        k = (k << 7)
+    k = (k << 7) + max(ln, 127)
+    return k
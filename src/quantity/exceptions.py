@@ -18,9 +18,20 @@
 """Quantity specific exceptions."""
 
 import operator
+from types import MappingProxyType
 from typing import Any, Callable
 
 
+# symbols of operators used in messages of UndefinedResultError
+_OP_SYMS = MappingProxyType({
+    operator.mul: '*',
+    operator.truediv: '/',
+    operator.floordiv: '//',
+    operator.mod: '%',
+    operator.pow: '**'
+    })
+
+
 class QuantityError(ValueError):
     """Raised when a quantity can not be instanciated."""
 
@@ -35,17 +46,9 @@ class IncompatibleUnitsError(QuantityError):
 class UndefinedResultError(QuantityError):
     """Raised when operation results in an undefined quantity."""
 
-    _op_syms = {
-        operator.mul: '*',
-        operator.truediv: '/',
-        operator.floordiv: '//',
-        operator.mod: '%',
-        operator.pow: '**'
-        }
-
     def __init__(self, op: Callable[[Any, Any], Any],
                  operand1: Any, operand2: Any):
-        msg = f"Undefined result: {operand1} {self._op_syms[op]} {operand2}"
+        msg = f"Undefined result: {operand1} {_OP_SYMS[op]} {operand2}"
         QuantityError.__init__(self, msg)
 
 
@@ -411,7 +411,7 @@ class Currency(Unit):
 
     def __repr__(self) -> str:
         """repr(self)"""
-        return "%s(%s)" % (self.__class__.__name__, repr(self._symbol))
+        return f"{self.__class__.__name__}({self._symbol!r})"
 
 
 class MoneyMeta(QuantityMeta):
@@ -80,6 +80,26 @@ ItemTupleT = Tuple[ItemT[T], ...]
 ItemListT = List[ItemT[T]]
 
 
+# helper functions used in normalization of terms (module level in order to
+# avoid the descriptor look-up in hot loops)
+
+def _normalize_elem(elem: ElemT[T]) -> ItemIterableT[T]:
+    """Return the decomposition of elem (list of items)."""
+    if isinstance(elem, Rational):
+        return [(elem, 1)]
+    elif elem.is_base_elem():
+        return [(elem, 1)]
+    else:
+        return cast(ItemIterableT[T], elem.normalized_definition)
+
+
+def _norm_sort_key(elem: ElemT[T]) -> int:
+    """Return sort key for `elem` used for normalized form of term."""
+    if isinstance(elem, Rational):
+        return -1
+    return elem.norm_sort_key()
+
+
 class Term(ItemSequenceT[T]):
     """Holds definitions of multidimensional items.
 
@@ -89,24 +109,10 @@ class Term(ItemSequenceT[T]):
     ((x, 1), (y, 3), (z, -2)) means x * y ** 3 / z ** 2
     """
 
-    __slots__ = ['_items', '_normalized', '_hash']
-
-    @staticmethod
-    def normalize_elem(elem: ElemT[T]) -> ItemIterableT[T]:
-        """Return the decomposition of elem (list of items)."""
-        if isinstance(elem, Rational):
-            return [(elem, 1)]
-        elif elem.is_base_elem():
-            return [(elem, 1)]
-        else:
-            return cast(ItemIterableT[T], elem.normalized_definition)
+    __slots__ = ['_items', '_normalized', '_hash', '_str']
 
-    @staticmethod
-    def norm_sort_key(elem: ElemT[T]) -> int:
-        """Return sort key for `elem` used for normalized form of term."""
-        if isinstance(elem, Rational):
-            return -1
-        return elem.norm_sort_key()
+    normalize_elem = staticmethod(_normalize_elem)
+    norm_sort_key = staticmethod(_norm_sort_key)
 
     def __init__(self, items: ItemIterableT[T] = (),
                  reduce_items: bool = True):
@@ -150,23 +156,26 @@ class Term(ItemSequenceT[T]):
                         return ()
                     else:
                         return (elem1, exp),
-                # elements convertible?
-                try:
-                    # noinspection PyProtectedMember
-                    conv = elem2._get_factor(elem1)
-                except TypeError:
-                    pass
-                else:
-                    if conv is not None:
-                        return tuple(_filter_items(((conv ** exp2, 1),
-                                                    (elem1, exp1 + exp2))))
+                # elements convertible? (only elements having the same sort
+                # key can be converted, so avoid the exception otherwise)
+                if _norm_sort_key(elem1) == _norm_sort_key(elem2):
+                    try:
+                        # noinspection PyProtectedMember
+                        conv = elem2._get_factor(elem1)
+                    except TypeError:
+                        pass
+                    else:
+                        if conv is not None:
+                            return tuple(_filter_items(((conv ** exp2, 1),
+                                                        (elem1,
+                                                         exp1 + exp2))))
                 if keep_item_order:
                     return tuple(_filter_items(((elem1, exp1),
                                                 (elem2, exp2))))
                 else:
                     items = sorted(((elem1, exp1), (elem2, exp2)),
                                    key=lambda item:
-                                   self.norm_sort_key(item[0]))
+                                   _norm_sort_key(item[0]))
                     return tuple(_filter_items(items))
             # third most relevant case: non-numeric + numeric element
             if isinstance(elem2, Rational) and \
@@ -178,7 +187,7 @@ class Term(ItemSequenceT[T]):
                 if num != 1:
                     return (num, 1),
         # more than 2 items or number of items unknown:
-        norm_sort_key = self.norm_sort_key
+        norm_sort_key = _norm_sort_key
         sort_key: Callable[[Tuple[int, Any]], int] = lambda x: x[0]
         if keep_item_order:
             key2_first_idx_map = {-1: -1, 0: 0}
@@ -241,7 +250,7 @@ class Term(ItemSequenceT[T]):
             return self._normalized
         except AttributeError:
             pass
-        it = _iter_normalized(self, self.normalize_elem)
+        it = _iter_normalized(self, _normalize_elem)
         items = self._reduce_items(it, keep_item_order=False)
         if items == self._items:  # self is already normalized
             self._normalized = self
@@ -282,8 +291,13 @@ class Term(ItemSequenceT[T]):
         num = self.num_elem
         if num is None:
             return dflt_num, self
-        else:
-            return num, Term(self[1:])
+        if getattr(self, '_normalized', None) is self:
+            # the non-numerical part of a normalized term is normalized, so
+            # it neither needs to be reduced nor normalized again
+            term: Term[T] = Term(self._items[1:], reduce_items=False)
+            term._normalized = term
+            return num, term
+        return num, Term(self[1:])
 
     def reciprocal(self) -> Term[T]:
         """1 / `self`"""
@@ -382,6 +396,10 @@ class Term(ItemSequenceT[T]):
 
     def __str__(self) -> str:
         """str(self)"""
+        try:
+            return self._str  # type: ignore
+        except AttributeError:
+            pass
         elems_pos_exp = []
         elems_neg_exp = []
         exp_map = [1, -1]
@@ -404,7 +422,8 @@ class Term(ItemSequenceT[T]):
             neg_exp_part = _MUL_SIGN.join(elems_neg_exp)
         else:
             div_sign = neg_exp_part = ''
-        return pos_exp_part + div_sign + neg_exp_part
+        self._str = term_str = pos_exp_part + div_sign + neg_exp_part
+        return term_str
 
 
 # helper functions
@@ -158,3 +158,14 @@ def test_alloc_inconsistent_ratios(qty: Quantized,
                                    exc: Type[Exception]) -> None:
     with pytest.raises(exc):
         _ = qty.allocate(ratios)
+
+
+def test_alloc_many_portions() -> None:
+    qty = Quantized(Decimal(1000))
+    ratios = list(range(1, 1001))
+    portions, remainder = qty.allocate(ratios)
+    assert repr(remainder) == repr(Quantized(0))
+    assert sum(portion.amount for portion in portions) == qty.amount
+    assert all(abs(portion.amount - Fraction(1000 * ratio, 500500)) <
+               Decimal("0.015")
+               for portion, ratio in zip(portions, ratios))
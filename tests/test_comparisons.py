@@ -80,6 +80,34 @@ def test_qty_eq_non_qty(qty_str: str, rhs: Any) -> None:
     assert lhs != rhs
 
 
+@pytest.mark.parametrize(("lhs", "rhs", "equal"),
+                         [
+                             (GRAM, GRAM, True),
+                             (GRAM, Unit('g'), True),
+                             (GRAM, KILOGRAM, False),
+                             (CELSIUS, KELVIN, False),
+                             (METRE, GRAM, False),
+                             (METRE, 'm', False),
+                             ],
+                         ids=lambda p: str(p))
+def test_unit_eq(lhs: Unit, rhs: Any, equal: bool) -> None:
+    assert (lhs == rhs) is equal
+    assert (lhs != rhs) is not equal
+
+
+@pytest.mark.parametrize(("amnt", "unit"),
+                         [
+                             (Decimal("17.3"), GRAM),
+                             (Fraction(1, 3), KILOGRAM),
+                             (50, CELSIUS),
+                             ],
+                         ids=lambda p: str(p))
+def test_qty_hash(amnt: Rational, unit: Unit) -> None:
+    qty = amnt * unit
+    assert hash(qty) == hash((qty.amount, qty.unit))
+    assert hash(qty) == hash(amnt * unit)
+
+
 def test_eq_qty_without_conv(qty_cls_without_conv: QuantityMeta) -> None:
     unit1, unit2 = qty_cls_without_conv.units()
     qty1 = 5 * unit1
@@ -15,15 +15,17 @@
 
 from fractions import Fraction
 from numbers import Rational, Real
+from typing import List
 
 import pytest
 from decimalfp import Decimal
 
 from quantity import IncompatibleUnitsError, Quantity, Unit
 from quantity.predefined import (
-    CELSIUS, CUBIC_CENTIMETRE, CUBIC_METRE, DAY, FAHRENHEIT, GIGAHERTZ, GRAM,
-    HERTZ, JOULE, KELVIN, KILOWATT, KILOWATT_HOUR, LITRE, METRE, MILE_PER_HOUR,
-    MILLIGRAM, MILLIMETRE, MILLIWATT, NEWTON, SQUARE_METRE,
+    BIT, BYTE, CELSIUS, CUBIC_CENTIMETRE, CUBIC_METRE, DAY, FAHRENHEIT,
+    GIGAHERTZ, GRAM, HERTZ, JOULE, KELVIN, KILOBYTE, KILOWATT, KILOWATT_HOUR,
+    LITRE, METRE, MILE_PER_HOUR, MILLIGRAM, MILLIMETRE, MILLIWATT, NEWTON,
+    SQUARE_METRE,
     )
 
 
@@ -53,6 +55,7 @@ def test_convert(amnt: str, unit: Unit, to_unit: Unit, res_amnt: str) -> None:
     conv_back = conv_qty.convert(unit)
     assert conv_back.unit is unit
     assert conv_back.amount == amount
+    assert conv_back.convert(unit) is conv_back
 
 
 @pytest.mark.parametrize(("amnt", "unit", "to_unit"),
@@ -130,6 +133,7 @@ def test_qty_repr(value: Rational, unit: Unit) -> None:
 
 @pytest.mark.parametrize(("amnt", "unit", "fmt", "result"),
                          [(2.5, NEWTON, "", "2.5 N"),
+                          (Fraction(1, 3), NEWTON, "{a} {u}", "1/3 N"),
                           (Decimal("7.8"), FAHRENHEIT,
                            "{a:_>7.2f} {u}", "___7.80 °F"),
                           (Fraction(1, 3), KILOWATT_HOUR,
@@ -137,3 +141,41 @@ def test_qty_repr(value: Rational, unit: Unit) -> None:
                          ids=lambda p: str(p))
 def test_qty_format(amnt: Real, unit: Unit, fmt: str, result: str) -> None:
     assert format(amnt * unit, fmt) == result
+
+
+@pytest.mark.parametrize(("amnts", "unit", "to_unit"),
+                         [
+                             ([Decimal("17.3"), 5, Fraction(1, 3)],
+                              GRAM, MILLIGRAM),
+                             ([3, Decimal("0.25")], CUBIC_METRE, LITRE),
+                             ([30, Decimal("-7.5")], CELSIUS, KELVIN),
+                             ([400, 0], KELVIN, FAHRENHEIT),
+                             ([], GRAM, GRAM),
+                             ([1.5, 7, Decimal("0.3")], METRE, METRE),
+                             ([Fraction(1, 4), 2.5], METRE, MILLIMETRE),
+                             ([Decimal("0.3"), 5, 1.7], BYTE, BIT),
+                             ([Decimal("0.3"), Fraction(7, 3)], BYTE, BYTE),
+                             ([Decimal("13.7"), 9], BIT, KILOBYTE),
+                             ],
+                         ids=lambda p: str(p))
+def test_convert_amounts(amnts: List[Real], unit: Unit,
+                         to_unit: Unit) -> None:
+    res = to_unit.convert_amounts(amnts, unit)
+    qty_cls = unit.qty_cls
+    equivs = [qty_cls(amnt, unit).equiv_amount(to_unit) for amnt in amnts]
+    assert res == equivs
+    # results must also be identical in type and precision
+    assert [repr(amnt) for amnt in res] == [repr(amnt) for amnt in equivs]
+
+
+@pytest.mark.parametrize(("unit", "to_unit"),
+                         [
+                             (GRAM, MILLIMETRE),
+                             (CELSIUS, GIGAHERTZ),
+                             ],
+                         ids=lambda p: str(p))
+def test_convert_amounts_wrong_unit(unit: Unit, to_unit: Unit) -> None:
+    with pytest.raises(IncompatibleUnitsError):
+        _ = to_unit.convert_amounts([1, 2], unit)
+    with pytest.raises(TypeError):
+        _ = to_unit.convert_amounts([1, 2], 5)
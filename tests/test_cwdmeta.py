@@ -60,6 +60,9 @@ def test_base(cls: ClassWithDefinitionMeta) -> None:
     assert cls.definition.items[0][1] == 1
     assert str(cls.definition) == cls.__name__
     assert cls.normalized_definition == cls.definition
+    # definition of base class is created only once
+    assert cls.definition is cls.definition
+    assert cls.normalized_definition is cls.definition
 
 
 @pytest.mark.parametrize(("cls", "cdef"),
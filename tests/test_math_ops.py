@@ -26,10 +26,10 @@ from quantity import (
     Unit, UnitConversionError,
     )
 from quantity.predefined import (
-    CENTIMETRE, CUBIC_CENTIMETRE, Duration, FAHRENHEIT, GRAM, HECTARE, HOUR,
-    JOULE, KILOMETRE, KILOMETRE_PER_HOUR, LITRE, Length, METRE,
-    METRE_PER_SECOND_SQUARED, MICROSECOND, MILLIGRAM, MILLIMETRE, MILLIWATT,
-    MINUTE, NEWTON, SECOND, SQUARE_METRE, TERAWATT,
+    CENTIMETRE, CUBIC_CENTIMETRE, Duration, FAHRENHEIT, GRAM, HECTARE, HERTZ,
+    HOUR, JOULE, KILOHERTZ, KILOMETRE, KILOMETRE_PER_HOUR, LITRE, Length,
+    METRE, METRE_PER_SECOND_SQUARED, MICROSECOND, MILLIGRAM, MILLIMETRE,
+    MILLIWATT, MINUTE, NEWTON, SECOND, SQUARE_METRE, TERAWATT,
     )
 
 BinOpT = Callable[[Any, Any], Any]
@@ -198,6 +198,18 @@ def test_qty_mul_qty_undefined_result(qty1: Quantity, qty2: Quantity) -> None:
         _ = qty2 * qty1
 
 
+@pytest.mark.parametrize(("qty1", "qty2", "res"),
+                         [(3 * HERTZ, 5 * SECOND, 15),
+                          (2 * KILOHERTZ, 3 * MINUTE, 360000),
+                          ],
+                         ids=lambda p: str(p))
+def test_qty_mul_qty_scalar_result(qty1: Quantity, qty2: Quantity,
+                                   res: Rational) -> None:
+    assert qty1 * qty2 == res
+    assert qty2 * qty1 == res
+    assert qty1 * qty2.unit == res / qty2.amount
+
+
 @pytest.mark.parametrize(("qty", "unit"),
                          [(3 * MILLIGRAM, METRE_PER_SECOND_SQUARED),
                           (15 * MILLIMETRE, NEWTON),
@@ -343,6 +355,24 @@ def test_qty_div_unit_defined_result(qty: Quantity, unit: Unit) -> None:
         assert res.unit == res_unit
 
 
+@pytest.mark.parametrize(("unit", "qty"),
+                         [(JOULE, 3 * MINUTE),
+                          (METRE, 4 * MILLIMETRE),
+                          (CUBIC_CENTIMETRE, Decimal("2.5") * MILLIMETRE),
+                          ],
+                         ids=lambda p: str(p))
+def test_unit_div_qty_defined_result(unit: Unit, qty: Quantity) -> None:
+    res = unit / qty
+    res_amount, res_unit = unit / qty.unit
+    res_amount /= qty.amount
+    if res_unit is None:
+        assert res == res_amount
+    else:
+        assert isinstance(res, Quantity)
+        assert res.amount == res_amount
+        assert res.unit == res_unit
+
+
 @pytest.mark.parametrize("unit",
                          [KILOMETRE_PER_HOUR, JOULE],
                          ids=lambda p: str(p))
@@ -429,7 +459,7 @@ def test_pow_undefined_result(value: Rational, unit: Unit, exp: int) -> None:
 
 
 @pytest.mark.parametrize("unit",
-                         [NEWTON, FAHRENHEIT, CUBIC_CENTIMETRE],
+                         [NEWTON, FAHRENHEIT, CUBIC_CENTIMETRE, LITRE],
                          ids=lambda p: str(p))
 @pytest.mark.parametrize("value",
                          [Decimal("0.0003"),
@@ -439,6 +469,15 @@ def test_pow_undefined_result(value: Rational, unit: Unit, exp: int) -> None:
 def test_pow_one(value: Rational, unit: Unit) -> None:
     base = value * unit
     assert base == base ** 1
+    assert (base ** 1).unit is unit
+
+
+def test_pow_one_aliased_unit() -> None:
+    qty = 3 * LITRE
+    res = qty ** 1
+    assert res.unit is LITRE
+    assert repr(res) == repr(qty)
+    assert (LITRE ** 1).unit is LITRE
 
 
 @pytest.mark.parametrize("unit",
@@ -13,6 +13,7 @@
 
 """Test constructors for Quantities and Units."""
 
+from fractions import Fraction
 from typing import Any, Tuple
 
 import pytest
@@ -113,6 +114,8 @@ def test_simple_derived_qty(qty_a: Tuple[str, str, QuantityMeta]) -> None:
     assert not R.is_base_cls()
     assert R.is_derived_cls()
     assert R.quantum == 1
+    assert R(Decimal("2.7")).amount == 3
+    assert R(Fraction(7, 3)).amount == 2
     unit = R.ref_unit
     assert isinstance(unit, Unit)
     assert A.ref_unit is not None   # for mypy
@@ -176,6 +179,7 @@ def test_simple_qty_units(qty_simple: QuantityMeta, symbol: str, name: str) \
     assert unit in Q.units()
     assert unit._definition is None
     assert unit.definition == UnitDefT(((unit, 1),))
+    assert unit.normalized_definition is unit.definition
     assert unit.symbol == symbol
     assert unit.name == name
     with pytest.raises(ValueError):
@@ -192,6 +192,16 @@ def test_add_sub_same_curr(amnt1: Real, amnt2: Real) -> None:
     assert amnt2 * EUR - amnt1 * EUR == (amnt2 - amnt1) * EUR
 
 
+@pytest.mark.parametrize("amnt", [Decimal("1.5"), 3, Fraction(1, 4)],
+                         ids=lambda p: str(p))
+def test_sub_same_curr_zero_diff(amnt: Real) -> None:
+    mny = Money(amnt, EUR)
+    diff = mny - mny
+    assert repr(diff) == repr(Money(0, EUR))
+    assert str(diff) == "0 EUR"
+    assert repr(mny + -mny) == repr(Money(0, EUR))
+
+
 @pytest.mark.parametrize(("amnt1", "amnt2"),
                          [(3, Decimal(8)),
                           (2.5, 7),
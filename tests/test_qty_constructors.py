@@ -13,10 +13,11 @@
 
 """Test constructors for Quantity instances.."""
 
+import pickle
 from decimal import Decimal as StdLibDecimal
 from fractions import Fraction
 from numbers import Rational, Real
-from typing import Any
+from typing import Any, Optional
 
 import pytest
 from decimalfp import Decimal
@@ -75,6 +76,92 @@ def test_qty_with_quantum(amnt: Rational) -> None:
     assert dv.amount == Decimal(amnt / quant, 0) * quant
 
 
+@pytest.mark.parametrize("unit", [None, MILLIGRAM, BYTE],
+                         ids=("None", "mg", "B"))
+@pytest.mark.parametrize("qty_cls", [Quantity, Mass, DataVolume],
+                         ids=("Quantity", "Mass", "DataVolume"))
+def test_qtys_from_amnts(qty_cls: QuantityMeta, unit: Optional[Unit]) \
+        -> None:
+    amnts = [17, Fraction(2, 7), Decimal("9283.10006"), 3.5, "0.004"]
+    if unit is None and qty_cls is Quantity:
+        with pytest.raises(QuantityError):
+            _ = qty_cls.from_amounts(amnts, unit)
+    elif unit is not None and qty_cls not in (Quantity, unit.qty_cls):
+        with pytest.raises(QuantityError):
+            _ = qty_cls.from_amounts(amnts, unit)
+    else:
+        qtys = qty_cls.from_amounts(amnts, unit)
+        assert qtys == [qty_cls(amnt, unit) for amnt in amnts]
+        assert all(qty.unit is (unit or qty_cls.ref_unit) for qty in qtys)
+
+
+def test_qtys_from_amnts_wrong_unit_type() -> None:
+    with pytest.raises(TypeError):
+        # noinspection PyTypeChecker
+        _ = Mass.from_amounts([1, 2], "g")  # type: ignore
+
+
+class Portion(Quantity, ref_unit_symbol="prt", quantum=Decimal("0.01")):
+    pass
+
+
+SEVENFOLD = Portion.new_unit("prt7", define_as=7 * Portion.ref_unit)
+
+
+@pytest.mark.parametrize("amnt",
+                         [3.7, Fraction(2, 7), Decimal("9283.10006")],
+                         ids=lambda p: str(p))
+def test_qty_with_fractional_quantum(amnt: Rational) -> None:
+    quant = SEVENFOLD.quantum
+    assert quant == Fraction(1, 700)
+    assert SEVENFOLD.quantum is quant
+    prt = Portion(amnt, SEVENFOLD)
+    assert prt.amount == round(Fraction(amnt) / quant) * quant
+
+
+class Thirds(Quantity, ref_unit_symbol="thd", quantum=Fraction(1, 3)):
+    pass
+
+
+class Nickels(Quantity, ref_unit_symbol="nck", quantum=Decimal("0.05")):
+    pass
+
+
+TRIPLE_NICKEL = Nickels.new_unit("nck3", define_as=3 * Nickels.ref_unit)
+
+
+@pytest.mark.parametrize("amnt",
+                         [Decimal("1.005"), Decimal(3), Decimal("2.5"),
+                          Fraction(7, 3), Fraction(5, 2)],
+                         ids=lambda p: str(p))
+@pytest.mark.parametrize("unit", [Thirds.ref_unit, TRIPLE_NICKEL],
+                         ids=lambda p: str(p))
+def test_qty_quantized_result_type(amnt: Rational, unit: Unit) -> None:
+    quant = unit.quantum
+    assert quant is not None
+    qty = unit.qty_cls(amnt, unit)
+    res_amnt = Decimal(amnt / quant, 0) * quant
+    # check type and precision as well
+    assert repr(qty.amount) == repr(res_amnt)
+
+
+class Units(Quantity, ref_unit_symbol="u1", quantum=Decimal("1.0")):
+    pass
+
+
+@pytest.mark.parametrize(("amnt", "res_amnt"),
+                         [(Decimal("2.7"), Decimal(3, 1)),
+                          (Fraction(7, 3), Decimal(2, 1)),
+                          (0, Decimal(0)),
+                          ],
+                         ids=lambda p: str(p))
+def test_qty_with_quantum_one_with_precision(amnt: Rational,
+                                             res_amnt: Decimal) -> None:
+    qty = Units(amnt)
+    assert repr(qty.amount) == repr(res_amnt)
+    assert str(qty) == f"{res_amnt} u1"
+
+
 @pytest.mark.parametrize("unit", [5, 'a'], ids=("5", "'a'"))
 def test_wrong_unit_type(unit: Any) -> None:
     with pytest.raises(TypeError):
@@ -152,3 +239,18 @@ def test_qty_from_amnt_div_unit(amnt: Real) -> None:
     qty = amnt / SECOND
     assert qty.amount == amnt
     assert qty.unit is HERTZ
+
+
+@pytest.mark.parametrize(("amnt", "unit"),
+                         [(17, METRE),
+                          (Fraction(2, 7), KILOWATT),
+                          (Decimal("-9283.10006"), CELSIUS),
+                          ],
+                         ids=lambda p: str(p))
+def test_pickle(amnt: Rational, unit: Unit) -> None:
+    qty = amnt * unit
+    res = pickle.loads(pickle.dumps(qty))
+    assert type(res) is type(qty)
+    assert res.amount == qty.amount
+    assert res.unit is qty.unit
+    assert pickle.loads(pickle.dumps(unit)) is unit
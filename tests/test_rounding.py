@@ -71,10 +71,10 @@ def test_quantize_linear_scaled(qty_amnt: Rational, qty_unit: Unit,
     assert isinstance(qty, Quantity)
     assert quantized.unit is qty_unit
     equiv = quant.equiv_amount(qty_unit)
-    if isinstance(qty_amnt, int):
+    if isinstance(qty_amnt, (int, Decimal)):
         res_amnt = Decimal(qty_amnt).quantize(equiv, rounding_mode)
-    elif isinstance(qty_amnt, Decimal):
-        res_amnt = qty_amnt.quantize(equiv, rounding_mode)
+        # check type and precision as well
+        assert repr(quantized.amount) == repr(res_amnt)
     else:  # handle Fraction
         mult = Decimal(qty_amnt / equiv, 3).adjusted(0, rounding_mode)
         if mult == 0 and rounding_mode in (ROUNDING.ROUND_05UP,
@@ -84,6 +84,20 @@ def test_quantize_linear_scaled(qty_amnt: Rational, qty_unit: Unit,
     assert quantized.amount == res_amnt
 
 
+@pytest.mark.parametrize("qty_amnt",
+                         [Decimal("2.5"), Decimal(3), Decimal("0.1"),
+                          Decimal(-13)],
+                         ids=lambda p: str(p))
+def test_quantize_fractional_quant_to_decimal(qty_amnt: Decimal) -> None:
+    qty = qty_amnt * METRE
+    for quant_amnt in (Fraction(1, 4), Fraction(1, 3)):
+        quantized = qty.quantize(quant_amnt * METRE)
+        res_amnt = qty_amnt.quantize(quant_amnt)
+        assert type(quantized.amount) is type(res_amnt)
+        # check precision as well
+        assert repr(quantized.amount) == repr(res_amnt)
+
+
 @pytest.mark.parametrize("quant_unit",
                          [GRAM, POUND, MILLIWATT],
                          ids=lambda p: str(p))
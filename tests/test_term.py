@@ -144,6 +144,9 @@ def test_split(term: TElemTerm, splitted: Tuple[Rational, TElemTerm]) -> None:
     if not splitted:
         splitted = (1, term)
     assert term.split() == splitted
+    num, rest = term.normalized().split()
+    assert rest.is_normalized
+    assert rest == splitted[1]
 
 
 # noinspection PyMissingTypeHints
@@ -232,6 +235,8 @@ def test_str() -> None:
     t2 = TElemTerm([(y, 2), (x, -1), (z, 3)])
     assert str(t2) == 'y%s%sz%s%sx' % (_POWER_CHARS[2], _MUL_SIGN,
                                        _POWER_CHARS[3], _DIV_SIGN)
+    # string representation is cached
+    assert str(t2) is str(t2)
 
 
 def test_repr() -> None: